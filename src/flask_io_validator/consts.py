@@ -1,4 +1,4 @@
 REQUEST_BODY_PARAM = "request_body"
 REQUEST_ARGS_KWARG = "request_args"
 
-RESERVED_KWARGS = {REQUEST_BODY_PARAM, REQUEST_ARGS_KWARG, "return"}
+RESERVED_KWARGS = frozenset({REQUEST_BODY_PARAM, REQUEST_ARGS_KWARG, "return"})
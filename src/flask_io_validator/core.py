@@ -1,6 +1,17 @@
 import inspect
 from functools import wraps
-from typing import Callable
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
 
 import pydantic
 from flask import request
@@ -14,6 +25,141 @@ from .exceptions import (
 )
 from .schemas import APICallError, ErrorType, StrictBaseModel
 
+_VALIDATION_ERROR_TYPE = ErrorType.VALIDATION
+
+UrlVarsCoercer = Callable[
+    [Mapping[str, Any]], Tuple[Dict[str, Any], List[Dict[str, Any]]]
+]
+
+
+def _to_str(value: Any) -> str:
+    # Same coercions as pydantic v1's str_validator
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return str(value)
+    raise TypeError
+
+
+def _to_uuid(value: Any) -> UUID:
+    # Werkzeug's uuid converter already yields UUID instances
+    if isinstance(value, UUID):
+        return value
+    if isinstance(value, str):
+        return UUID(value)
+    raise TypeError
+
+
+# Annotation -> (coercer, pydantic error type, pydantic error message)
+_SIMPLE_URL_VAR_TYPES = {
+    int: (int, "type_error.integer", "value is not a valid integer"),
+    float: (float, "type_error.float", "value is not a valid float"),
+    str: (_to_str, "type_error.str", "str type expected"),
+    UUID: (_to_uuid, "type_error.uuid", "value is not a valid uuid"),
+}
+
+
+def _compile_url_vars_coercer(
+    annotated_params: Dict[str, Tuple[Any, Any]]
+) -> Optional[UrlVarsCoercer]:
+    """Generate a function coercing URL variables without going through pydantic.
+
+    Only annotations listed in ``_SIMPLE_URL_VAR_TYPES`` are supported, None is
+    returned if any other annotation is used. The generated function returns the
+    coerced values and a list of errors shaped like pydantic's ``errors()``.
+    """
+    if not all(
+        isinstance(annotation, type) and annotation in _SIMPLE_URL_VAR_TYPES
+        for annotation, _ in annotated_params.values()
+    ):
+        return None
+
+    namespace: Dict[str, Any] = {}
+    lines = [
+        "def coerce_url_vars(url_vars):",
+        "    values = {}",
+        "    errors = []",
+    ]
+    for i, (name, (annotation, _)) in enumerate(annotated_params.items()):
+        coercer, error_type, error_msg = _SIMPLE_URL_VAR_TYPES[annotation]
+        namespace[f"_coerce_{i}"] = coercer
+        namespace[f"_error_{i}"] = {
+            "loc": (name,),
+            "msg": error_msg,
+            "type": error_type,
+        }
+        lines += [
+            "    try:",
+            f"        values[{name!r}] = _coerce_{i}(url_vars[{name!r}])",
+            "    except (TypeError, ValueError):",
+            f"        errors.append(_error_{i})",
+        ]
+    lines.append("    return values, errors")
+
+    exec(compile("\n".join(lines), "<url_vars_coercer>", "exec"), namespace)
+    return namespace["coerce_url_vars"]
+
+
+def _build_model_url_vars_coercer(
+    annotated_params: Dict[str, Tuple[Any, Any]]
+) -> UrlVarsCoercer:
+    """Build a pydantic model based URL variables coercer, for any annotations."""
+    UrlVarsModel = pydantic.create_model(
+        "UrlVarsModel", __base__=StrictBaseModel, **annotated_params
+    )
+
+    def coerce_url_vars(url_vars):
+        # Validate against the prebuilt model without instantiating it
+        values, _, error = pydantic.validate_model(UrlVarsModel, url_vars)
+        if error is not None:
+            return {}, error.errors()
+        return values, []
+
+    return coerce_url_vars
+
+
+def _format_validation_errors(
+    errors: List[Dict[str, Any]]
+) -> Tuple[List[APICallError], int]:
+    """Build the 400 response from errors shaped like pydantic's ``errors()``."""
+    construct_error = APICallError.construct
+    return (
+        [
+            construct_error(
+                type=_VALIDATION_ERROR_TYPE,
+                subtype=error["type"],
+                message=f"{'.'.join(map(str, error['loc']))}: {error['msg']}",
+            )
+            for error in errors
+        ],
+        400,
+    )
+
+
+def _raise_url_vars_mismatch(
+    decorated_f: Callable,
+    declared_url_vars: AbstractSet[str],
+    non_reserved_params: AbstractSet[str],
+) -> NoReturn:
+    """Raise the error describing why the URL rule doesn't match the parameters."""
+    illegal_url_vars = declared_url_vars.intersection(RESERVED_KWARGS)
+    if len(illegal_url_vars) != 0:
+        raise ReservedKeywordsError(
+            f"{illegal_url_vars} are reserved keywords and cannot be used as URL "
+            "variables."
+        )
+
+    if len(declared_url_vars - non_reserved_params) != 0:
+        raise MissingParametersError(
+            f"{declared_url_vars - non_reserved_params} are declared as URL "
+            f"variables but are missing in {decorated_f}'s parameters."
+        )
+
+    raise MissingURLVariableError(
+        f"{set(non_reserved_params - declared_url_vars)} are declared in the "
+        f"{decorated_f}'s parameters but are not declared as URL variables."
+    )
+
 
 def validate_url_vars(decorated_f: Callable) -> Callable:
     """Decorator to apply on flask view functions to validate URL variables.
@@ -43,68 +189,43 @@ def validate_url_vars(decorated_f: Callable) -> Callable:
     MissingURLVariableError
         if a declared function parameter doesn't have a corresponding URL variable
     MissingTypeHintsError
-        if a parameter is missing a type hint
+        if a parameter is missing a type hint, raised when decorating the function
     """
+    non_reserved_params = (
+        frozenset(inspect.signature(decorated_f).parameters) - RESERVED_KWARGS
+    )
+
+    annotated_params = {
+        k: (v, ...)
+        for k, v in decorated_f.__annotations__.items()
+        if k not in RESERVED_KWARGS
+    }
+    missing_annotations = non_reserved_params - annotated_params.keys()
+    if len(missing_annotations) != 0:
+        raise MissingTypeHintsError(
+            f"{set(missing_annotations)} exist in the {decorated_f}'s parameters but "
+            "are missing annotations. Please add type hints to these parameters."
+        )
+
+    coerce_url_vars = _compile_url_vars_coercer(annotated_params)
+    if coerce_url_vars is None:
+        coerce_url_vars = _build_model_url_vars_coercer(annotated_params)
 
     @wraps(decorated_f)
     def transformed_f(*args, **kwargs):
         declared_url_vars = request.url_rule.arguments
-        illegal_url_vars = declared_url_vars.intersection(RESERVED_KWARGS)
-        if len(illegal_url_vars) != 0:
-            raise ReservedKeywordsError(
-                f"{illegal_url_vars} are reserved keywords and cannot be used as URL "
-                "variables."
-            )
-
-        non_reserved_params = set(
-            inspect.signature(decorated_f).parameters.keys()
-        ) - set(RESERVED_KWARGS)
-        if len(declared_url_vars - non_reserved_params) != 0:
-            raise MissingParametersError(
-                f"{declared_url_vars - non_reserved_params} are declared as URL "
-                f"variables but are missing in {decorated_f}'s parameters."
-            )
-
-        if len(non_reserved_params - declared_url_vars) != 0:
-            raise MissingURLVariableError(
-                f"{non_reserved_params - declared_url_vars} are declared in the "
-                f"{decorated_f}'s parameters but are not declared as URL variables."
-            )
-
-        annotated_params = {
-            k: (v, ...)
-            for k, v in decorated_f.__annotations__.items()
-            if k not in RESERVED_KWARGS
-        }
-        missing_annotations = declared_url_vars - set(annotated_params.keys())
-        if len(missing_annotations) != 0:
-            raise MissingTypeHintsError(
-                f"{missing_annotations} are declared as URL variables, exist in the "
-                f"{decorated_f}'s parameters but are missing annotations. Please add "
-                "type hints to these parameters."
+        if declared_url_vars != non_reserved_params:
+            _raise_url_vars_mismatch(
+                decorated_f, declared_url_vars, non_reserved_params
             )
+        if len(non_reserved_params) == 0:
+            return decorated_f(*args, **kwargs)
 
-        try:
-            UrlVarsModel = pydantic.create_model(
-                "UrlVarsModel", __base__=StrictBaseModel, **annotated_params
-            )
-            url_vars_values = request.view_args
-
-            validated_values = UrlVarsModel(**url_vars_values)
-        except pydantic.ValidationError as e:
-            return (
-                [
-                    APICallError(
-                        type=ErrorType.VALIDATION,
-                        subtype=error["type"],
-                        message=".".join(error["loc"]) + ": " + error["msg"],
-                    )
-                    for error in e.errors()
-                ],
-                400,
-            )
+        validated_values, errors = coerce_url_vars(request.view_args)
+        if len(errors) != 0:
+            return _format_validation_errors(errors)
 
-        new_kwargs = {**kwargs, **validated_values.dict()}
-        return decorated_f(*args, **new_kwargs)
+        kwargs.update(validated_values)
+        return decorated_f(*args, **kwargs)
 
     return transformed_f